@@ -1,6 +1,7 @@
 # app.py
 import os
 import random
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, request, jsonify, render_template, send_from_directory
 from flask_cors import CORS
 
@@ -54,6 +55,7 @@ else:
 
 sci_box = SciBoxHelper(API_KEY)
 user_system = UserLevelSystem(CNT_QUESTION, CNT_CODES)
+executor = ThreadPoolExecutor(max_workers=4)
 
 interview_state = {
     'current_question_index': 0,
@@ -94,17 +96,17 @@ def start_interview():
         }
     })
 
-@app.route('/api/next_question', methods=['POST'])
-def next_question():
-    global interview_state
-    
+def completion_payload():
+    return {
+        'completed': True,
+        'total_score': interview_state['total_score'],
+        'user_level': user_system.get_user_lvl(),
+        'max_score': CNT_QUESTION * 10 + CNT_CODES * 20
+    }
+
+def build_next_item():
     if interview_state['completed']:
-        return jsonify({
-            'completed': True,
-            'total_score': interview_state['total_score'],
-            'user_level': user_system.get_user_lvl(),
-            'max_score': CNT_QUESTION * 10 + CNT_CODES * 20
-        })
+        return completion_payload()
     
     if interview_state['current_question_index'] < CNT_QUESTION:
         topic = random.choice(THEME)
@@ -114,7 +116,7 @@ def next_question():
         interview_state['current_question'] = question
         interview_state['current_topic'] = topic
         
-        return jsonify({
+        return {
             'type': 'text',
             'question': question,
             'topic': topic,
@@ -125,7 +127,7 @@ def next_question():
                 'current_code': interview_state['current_code_index'],
                 'total_codes': CNT_CODES
             }
-        })
+        }
     
     elif interview_state['current_code_index'] < CNT_CODES:
         topic = random.choice(THEME)
@@ -135,7 +137,7 @@ def next_question():
         interview_state['current_task'] = task
         interview_state['current_topic'] = topic
         
-        return jsonify({
+        return {
             'type': 'code',
             'task': task,
             'topic': topic,
@@ -146,16 +148,20 @@ def next_question():
                 'current_code': interview_state['current_code_index'] + 1,
                 'total_codes': CNT_CODES
             }
-        })
+        }
     
     else:
         interview_state['completed'] = True
-        return jsonify({
-            'completed': True,
-            'total_score': interview_state['total_score'],
-            'user_level': user_system.get_user_lvl(),
-            'max_score': CNT_QUESTION * 10 + CNT_CODES * 20
-        })
+        return completion_payload()
+
+def record_score(score, index_key):
+    interview_state['total_score'] += score
+    interview_state[index_key] += 1
+    user_system.update_user_lvl(score)
+
+@app.route('/api/next_question', methods=['POST'])
+def next_question():
+    return jsonify(build_next_item())
 
 @app.route('/api/submit_answer', methods=['POST'])
 def submit_answer():
@@ -178,9 +184,7 @@ def submit_answer():
         score
     )
     
-    interview_state['total_score'] += score
-    interview_state['current_question_index'] += 1
-    user_system.update_user_lvl(score)
+    record_score(score, 'current_question_index')
     
     return jsonify({
         'score': score,
@@ -210,9 +214,7 @@ def submit_code():
         code
     )
     
-    interview_state['total_score'] += score
-    interview_state['current_code_index'] += 1
-    user_system.update_user_lvl(score)
+    record_score(score, 'current_code_index')
     
     return jsonify({
         'score': score,
@@ -222,6 +224,60 @@ def submit_code():
         'user_level': user_system.get_user_lvl()
     })
 
+@app.route('/api/submit_and_next', methods=['POST'])
+def submit_and_next():
+    global interview_state
+    
+    data = request.json or {}
+    question_type = interview_state.get('current_question_type')
+    
+    # Сложность следующего вопроса зависит от оценки, поэтому он генерируется
+    # после оценивания, но параллельно с генерацией обратной связи
+    if question_type == 'text':
+        question = interview_state['current_question']
+        answer = data.get('answer', '')
+        
+        score, explanation = sci_box.evaluate_answer(question, answer)
+        feedback_future = executor.submit(sci_box.generate_feedback, question, answer, score)
+        
+        record_score(score, 'current_question_index')
+        next_item = build_next_item()
+        
+        result = {
+            'score': score,
+            'explanation': explanation,
+            'feedback': feedback_future.result()
+        }
+    
+    elif question_type == 'code':
+        task = interview_state['current_task']
+        code = data.get('code', '')
+        
+        # Обратная связь по коду не зависит от оценки — запускаем сразу
+        feedback_future = executor.submit(sci_box.generate_code_feedback, task, code)
+        score, detailed_feedback = sci_box.evaluate_code(task, code)
+        
+        record_score(score, 'current_code_index')
+        next_item = build_next_item()
+        
+        result = {
+            'score': score,
+            'detailed_feedback': detailed_feedback,
+            'additional_feedback': feedback_future.result()
+        }
+    
+    else:
+        return jsonify({'error': 'No active question or coding task'}), 400
+    
+    result['type'] = question_type
+    result['total_score'] = interview_state['total_score']
+    result['user_level'] = user_system.get_user_lvl()
+    
+    return jsonify({
+        'result': result,
+        'next': next_item
+    })
+
 @app.route('/api/status', methods=['GET'])
 def status():
     return jsonify({
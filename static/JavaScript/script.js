@@ -51,6 +51,13 @@ class InterviewAPI {
         });
     }
 
+    async submitAndNext(payload) {
+        return await this.makeRequest('/submit_and_next', {
+            method: 'POST',
+            body: JSON.stringify(payload)
+        });
+    }
+
     async getStatus() {
         return await this.makeRequest('/status');
     }
@@ -209,42 +216,7 @@ class InterviewApp {
             
             this.removeLastLoadingMessage();
             
-            if (response.completed) {
-                this.completeInterview(response);
-                return;
-            }
-            
-            if (response.type === 'text') {
-                this.currentQuestionType = 'text';
-                this.currentQuestion = response.question;
-                
-                this.addMessage("AI Interviewer", 
-                    `Topic: <strong>${response.topic}</strong><br>
-                     Difficulty: <strong>${response.difficulty}</strong><br><br>
-                     ${response.question}`, 
-                    "ai");
-                
-                document.getElementById('user-input').disabled = false;
-                document.getElementById('send-btn').disabled = false;
-                document.getElementById('user-input').focus();
-                
-            } else if (response.type === 'code') {
-                this.currentQuestionType = 'code';
-                this.currentTask = response.task;
-                
-                this.addMessage("AI Interviewer", 
-                    `Topic: <strong>${response.topic}</strong><br>
-                     Difficulty: <strong>${response.difficulty}</strong><br><br>
-                     ${response.task}`, 
-                    "ai");
-                
-                this.codeEditor.setValue("# Write your solution here\n\n");
-                this.codeEditor.setOption('readOnly', false);
-                document.getElementById('run-btn').disabled = false;
-                document.getElementById('submit-btn').disabled = false;
-            }
-            
-            this.updateProgress(response.progress);
+            this.showQuestion(response);
             
         } catch (error) {
             this.removeLastLoadingMessage();
@@ -254,6 +226,45 @@ class InterviewApp {
         }
     }
 
+    showQuestion(response) {
+        if (response.completed) {
+            this.completeInterview(response);
+            return;
+        }
+        
+        if (response.type === 'text') {
+            this.currentQuestionType = 'text';
+            this.currentQuestion = response.question;
+            
+            this.addMessage("AI Interviewer", 
+                `Topic: <strong>${response.topic}</strong><br>
+                 Difficulty: <strong>${response.difficulty}</strong><br><br>
+                 ${response.question}`, 
+                "ai");
+            
+            document.getElementById('user-input').disabled = false;
+            document.getElementById('send-btn').disabled = false;
+            document.getElementById('user-input').focus();
+            
+        } else if (response.type === 'code') {
+            this.currentQuestionType = 'code';
+            this.currentTask = response.task;
+            
+            this.addMessage("AI Interviewer", 
+                `Topic: <strong>${response.topic}</strong><br>
+                 Difficulty: <strong>${response.difficulty}</strong><br><br>
+                 ${response.task}`, 
+                "ai");
+            
+            this.codeEditor.setValue("# Write your solution here\n\n");
+            this.codeEditor.setOption('readOnly', false);
+            document.getElementById('run-btn').disabled = false;
+            document.getElementById('submit-btn').disabled = false;
+        }
+        
+        this.updateProgress(response.progress);
+    }
+
     async sendAnswer() {
         const userInput = document.getElementById('user-input');
         const answer = userInput.value.trim();
@@ -270,7 +281,7 @@ class InterviewApp {
         this.addMessage("AI Interviewer", "Evaluating your answer...", "ai", true);
         
         try {
-            const response = await this.api.submitAnswer(answer);
+            const { result: response, next } = await this.api.submitAndNext({ answer });
             
             this.removeLastLoadingMessage();
             
@@ -289,7 +300,7 @@ class InterviewApp {
             document.getElementById('user-level').textContent = this.userLevel;
             
             setTimeout(() => {
-                this.nextQuestion();
+                this.showQuestion(next);
             }, 2000);
             
         } catch (error) {
@@ -315,7 +326,7 @@ class InterviewApp {
         this.addMessage("AI Interviewer", "Evaluating your solution...", "ai", true);
         
         try {
-            const response = await this.api.submitCode(code);
+            const { result: response, next } = await this.api.submitAndNext({ code });
             
             this.removeLastLoadingMessage();
             
@@ -338,7 +349,7 @@ class InterviewApp {
             document.getElementById('user-level').textContent = this.userLevel;
             
             setTimeout(() => {
-                this.nextQuestion();
+                this.showQuestion(next);
             }, 3000);
             
         } catch (error) {